@@ -14,18 +14,57 @@
 # limitations under the License.
 
 """A Langchain LLM component for connecting to Triton + TensorRT LLM backend."""
-import json
-import queue
+import asyncio
+import logging
+import sys
+import threading
 import time
+import uuid
+from collections import deque
 from functools import partial
-from typing import TYPE_CHECKING, Any, Dict, List, Optional, Union
+from multiprocessing import shared_memory
+from typing import Any, AsyncGenerator, Deque, Dict, List, Optional, Tuple
 
-from langchain.callbacks.manager import CallbackManagerForLLMRun
+from langchain.callbacks.manager import (
+    AsyncCallbackManagerForLLMRun,
+    CallbackManagerForLLMRun,
+)
 from langchain.llms.base import LLM
 from langchain.pydantic_v1 import Field, root_validator
+from langchain.schema import Generation, LLMResult
 
-if TYPE_CHECKING:
+try:
+    import numpy as np
     import tritonclient.grpc as grpcclient
+    import tritonclient.grpc.aio as grpcclient_aio
+    from tritonclient.utils import InferenceServerException, np_to_triton_dtype
+except ImportError as err:
+    _TRITON_IMPORT_ERROR: Optional[ImportError] = err
+    _OUTPUTS: Any = None
+    _PARAM_DTYPE: Any = None
+else:
+    _TRITON_IMPORT_ERROR = None
+    # tritonclient never mutates a requested-output list, so every request can
+    # share this one
+    _OUTPUTS = [grpcclient.InferRequestedOutput("OUTPUT_0")]
+    # all nine scalar sampling params packed into one aligned record; the
+    # field offsets double as the shared-memory offsets of the inputs
+    _PARAM_DTYPE = np.dtype(
+        [
+            ("INPUT_1", np.uint32),
+            ("runtime_top_k", np.uint32),
+            ("runtime_top_p", np.float32),
+            ("temperature", np.float32),
+            ("len_penalty", np.float32),
+            ("repetition_penalty", np.float32),
+            ("random_seed", np.uint64),
+            ("beam_width", np.uint32),
+            ("streaming", np.bool_),
+        ],
+        align=True,
+    )
+
+_LOGGER = logging.getLogger(__name__)
 
 
 class TensorRTLLM(LLM):
@@ -74,15 +113,23 @@ class TensorRTLLM(LLM):
 
     @property
     def _get_model_default_parameters(self) -> Dict[str, Any]:
-        return {
-            "tokens": self.tokens,
-            "top_k": self.top_k,
-            "top_p": self.top_p,
-            "temperature": self.temperature,
-            "repetition_penalty": self.repetition_penalty,
-            "length_penalty": self.length_penalty,
-            "beam_width": self.beam_width,
-        }
+        # built once and reused on every call; the sampling fields never
+        # change after init, and pydantic v1 blocks normal assignment of
+        # non-field attributes, hence object.__setattr__. Callers that mutate
+        # the params must copy first.
+        cached = getattr(self, "_default_params_cache", None)
+        if cached is None:
+            cached = {
+                "tokens": self.tokens,
+                "top_k": self.top_k,
+                "top_p": self.top_p,
+                "temperature": self.temperature,
+                "repetition_penalty": self.repetition_penalty,
+                "length_penalty": self.length_penalty,
+                "beam_width": self.beam_width,
+            }
+            object.__setattr__(self, "_default_params_cache", cached)
+        return cached
 
     @property
     def _invocation_params(self, **kwargs: Any) -> Dict[str, Any]:
@@ -92,10 +139,14 @@ class TensorRTLLM(LLM):
     @property
     def _identifying_params(self) -> Dict[str, Any]:
         """Get all the identifying parameters."""
-        return {
-            "server_url": self.server_url,
-            "model_name": self.model_name,
-        }
+        cached = getattr(self, "_identifying_params_cache", None)
+        if cached is None:
+            cached = {
+                "server_url": self.server_url,
+                "model_name": self.model_name,
+            }
+            object.__setattr__(self, "_identifying_params_cache", cached)
+        return cached
 
     @property
     def _llm_type(self) -> str:
@@ -118,75 +169,389 @@ class TensorRTLLM(LLM):
         Returns:
             The string generated by the model
         """
-        # pylint: disable-next=import-outside-toplevel
-        from tritonclient.utils import InferenceServerException
+        text_callback = None
+        if run_manager:
+            text_callback = partial(run_manager.on_llm_new_token, verbose=self.verbose)
+
+        invocation_params = dict(self._get_model_default_parameters)
+        invocation_params.update(kwargs)
+        invocation_params["prompts"] = [prompt]
+        model_params = dict(self._identifying_params)
+        model_params.update(kwargs)
+
+        pipe = _TokenPipe()
+        self.client.load_model(model_params["model_name"])
+        self.client.request_streaming(
+            model_params["model_name"], [pipe], **invocation_params
+        )
+
+        return self._stream_response(pipe, text_callback)
+
+    async def _acall(
+        self,
+        prompt: str,
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[AsyncCallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> str:
+        """
+        Execute an inference request without blocking the event loop.
+
+        One asyncio task replaces the thread the synchronous path would hold
+        for the whole generation, so a server can run many streams per
+        worker.
+
+        Args:
+            prompt: The prompt to pass into the model.
+            stop: A list of strings to stop generation when encountered
+
+        Returns:
+            The string generated by the model
+        """
+        invocation_params = dict(self._get_model_default_parameters)
+        invocation_params.update(kwargs)
+        invocation_params["prompts"] = [prompt]
+
+        client = getattr(self, "_async_client", None)
+        if client is None:
+            # created lazily so the grpc aio channel binds to the running loop
+            client = AsyncTritonClient(self.server_url)
+            object.__setattr__(self, "_async_client", client)
+
+        await client.load_model(self.model_name)
+        parts: List[str] = []
+        send_tokens = True
+        async for token in client.stream(self.model_name, **invocation_params):
+            mapped = _TOKEN_TABLE.get(token)
+            if mapped is _STOP:
+                send_tokens = False
+            elif mapped is not None:
+                token = mapped  # nosec
+            if send_tokens:
+                if run_manager:
+                    await run_manager.on_llm_new_token(token, verbose=self.verbose)
+                parts.append(token)
+        return "".join(parts)
+
+    def _generate(
+        self,
+        prompts: List[str],
+        stop: Optional[List[str]] = None,
+        run_manager: Optional[CallbackManagerForLLMRun] = None,
+        **kwargs: Any,
+    ) -> LLMResult:
+        """
+        Execute an inference request for a batch of prompts.
+
+        The prompts are stacked into a single batched request so the server's
+        dynamic batcher can schedule them as one GPU batch instead of N
+        sequential round-trips.
 
+        Args:
+            prompts: The prompts to pass into the model.
+            stop: A list of strings to stop generation when encountered
+
+        Returns:
+            An LLMResult with one generation per prompt
+        """
         text_callback = None
         if run_manager:
             text_callback = partial(run_manager.on_llm_new_token, verbose=self.verbose)
 
-        invocation_params = self._get_model_default_parameters
+        invocation_params = dict(self._get_model_default_parameters)
         invocation_params.update(kwargs)
-        invocation_params["prompt"] = [[prompt]]
-        model_params = self._identifying_params
+        invocation_params["prompts"] = list(prompts)
+        model_params = dict(self._identifying_params)
         model_params.update(kwargs)
 
-        result_queue: queue.Queue[Dict[str, str]] = queue.Queue()
+        pipes = [_TokenPipe() for _ in prompts]
         self.client.load_model(model_params["model_name"])
         self.client.request_streaming(
-            model_params["model_name"], result_queue, **invocation_params
+            model_params["model_name"], pipes, **invocation_params
         )
 
-        response = ""
+        # the stream callback fills every pipe concurrently, so the pipes can
+        # be drained one prompt at a time
+        generations = [
+            [Generation(text=self._stream_response(pipe, text_callback))]
+            for pipe in pipes
+        ]
+        return LLMResult(generations=generations)
+
+    def _stream_response(
+        self,
+        pipe: "_TokenPipe",
+        text_callback: Optional[Any],
+    ) -> str:
+        """Collect the streamed tokens for a single prompt."""
+        parts: List[str] = []
         send_tokens = True
+        items = pipe.items
         while True:
-            response_streaming = result_queue.get()
-
-            if response_streaming is None or isinstance(
-                response_streaming, InferenceServerException
-            ):
-                self.client.close_streaming()
+            if items:
+                kind, payload = items.popleft()
+                if kind is _TOK:
+                    mapped = _TOKEN_TABLE.get(payload)
+                    if mapped is _STOP:
+                        send_tokens = False
+                    elif mapped is not None:
+                        payload = mapped  # nosec
+                    if send_tokens:
+                        if text_callback:
+                            text_callback(payload)
+                        parts.append(payload)
+                elif kind is _END:
+                    break
+                else:
+                    _LOGGER.error("triton stream failed: %s", payload)
+                    break
+            elif pipe.done.is_set() and not items:
+                # done is set after the producer's last append, so an empty
+                # deque here really is the end of the stream
                 break
-            token = response_streaming["OUTPUT_0"]
-            if token in STOP_WORDS:
-                send_tokens = False
-            if text_callback and send_tokens:
-                if response_streaming["OUTPUT_0"] == "<0x0A>":
-                    token = "\n"  # nosec
-                text_callback(token)
-                response = response + token
-        return response
+            else:
+                pipe.done.wait(timeout=0.001)
+        return "".join(parts)
 
 
 STOP_WORDS = ["</s>"]
 BAD_WORDS = [""]
 RANDOM_SEED = 0
 
+# Single-lookup dispatch table for the decode loop: stop words map to the
+# _STOP sentinel (identity-compared), tokens needing substitution map to
+# their replacement text.
+_STOP = object()
+_TOKEN_TABLE: Dict[str, Any] = {word: _STOP for word in STOP_WORDS}
+_TOKEN_TABLE["<0x0A>"] = "\n"
+
+# interned pipe markers; the consumer branches on identity, never equality
+_TOK = sys.intern("tok")
+_END = sys.intern("end")
+_ERR = sys.intern("err")
+
+# (input name, expression for its value) in declaration order; drives both
+# the prebuilt input list and the generated param writer below
+_PARAM_SOURCES = (
+    ("INPUT_1", "tokens"),
+    ("runtime_top_k", "top_k"),
+    ("runtime_top_p", "top_p"),
+    ("temperature", "temperature"),
+    ("len_penalty", "length_penalty"),
+    ("repetition_penalty", "repetition_penalty"),
+    ("random_seed", "RANDOM_SEED"),
+    ("beam_width", "beam_width"),
+    ("streaming", "True"),
+)
+
+
+def _compile_param_writer() -> Any:
+    """Generate the specialized single-prompt param writer at import time.
+
+    The generated function unpacks the (buffer, template) pairs into locals
+    once and inlines one compare-and-write per param, replacing the generic
+    loop's per-call tuple iteration and dict lookups.
+    """
+    unpack = ", ".join(f"(b{i}, t{i})" for i in range(len(_PARAM_SOURCES)))
+    lines = [
+        "def _write_params(self, tokens, top_k, top_p, temperature, "
+        "repetition_penalty, length_penalty, beam_width):",
+        f"    ({unpack}) = self._param_pairs",
+        "    serialize = self._shm is None",
+    ]
+    for i, (_, expr) in enumerate(_PARAM_SOURCES):
+        lines += [
+            f"    if b{i}[0, 0] != {expr}:",
+            f"        b{i}[0, 0] = {expr}",
+            "        if serialize:",
+            f"            t{i}.set_data_from_numpy(b{i})",
+        ]
+    namespace: Dict[str, Any] = {"RANDOM_SEED": RANDOM_SEED}
+    exec("\n".join(lines), namespace)  # nosec pylint: disable=exec-used
+    return namespace["_write_params"]
+
+
+class _TokenPipe:
+    """A single-producer single-consumer token stream for one prompt.
+
+    Items are (kind, payload) tuples with kind one of _TOK, _END or _ERR.
+    deque.append/popleft are atomic under the GIL, so the per-token path
+    needs no lock; the Event fires once at end-of-stream (or on error).
+    """
+
+    __slots__ = ("items", "done")
+
+    def __init__(self) -> None:
+        self.items: Deque[Tuple[str, Any]] = deque()
+        self.done = threading.Event()
+
+
+class _StreamSink:
+    """Feeds the streamed responses of one request into its prompt pipes.
+
+    A plain class with __slots__ and a direct __call__ keeps the per-token
+    callback dispatch down to one bound-method invocation, without the
+    functools.partial wrapper frame the old per-stream callbacks paid.
+    """
+
+    __slots__ = ("pipes",)
+
+    def __init__(self, pipes: List[_TokenPipe]) -> None:
+        self.pipes = pipes
+
+    def __call__(self, response: Any) -> bool:
+        """Consume one response; return True once the stream is finished."""
+        if len(response.outputs) > 0:
+            # the very last response might have no output, just the final flag
+            texts = TritonClient.process_result(response)
+            for pipe, text in zip(self.pipes, texts):
+                pipe.items.append((_TOK, text))
+
+        if response.parameters["triton_final_response"].bool_param:
+            # end of the generation
+            for pipe in self.pipes:
+                pipe.items.append((_END, None))
+                pipe.done.set()
+            return True
+        return False
+
+    def fail(self, error: str) -> None:
+        """Propagate a stream error to every prompt pipe."""
+        for pipe in self.pipes:
+            pipe.items.append((_ERR, error))
+            pipe.done.set()
+
 
 class TritonClient:
     """An abstraction of the connection to a triton inference server."""
 
     def __init__(self, server_url: str) -> None:
         """Initialize the client."""
-        # pylint: disable-next=import-outside-toplevel
-        import tritonclient.grpc as grpcclient
+        if _TRITON_IMPORT_ERROR is not None:
+            raise _TRITON_IMPORT_ERROR
 
         self.server_url = server_url
         self.client = grpcclient.InferenceServerClient(server_url)
 
+        # One contiguous record backs all nine scalar sampling params; the
+        # per-input buffers are zero-copy views of its fields, so the
+        # single-prompt path allocates nothing at all.
+        self._param_record = np.zeros(1, dtype=_PARAM_DTYPE)
+        self._param_bufs = {
+            name: self._param_record[name].reshape(1, 1)
+            for name in _PARAM_DTYPE.names
+        }
+        self._param_templates = {
+            name: grpcclient.InferInput(name, [1, 1], np_to_triton_dtype(buf.dtype))
+            for name, buf in self._param_bufs.items()
+        }
+        for name, buf in self._param_bufs.items():
+            self._param_templates[name].set_data_from_numpy(buf)
+        self._prompt_input = grpcclient.InferInput("INPUT_0", [1, 1], "BYTES")
+
+        self._shm: Optional[shared_memory.SharedMemory] = None
+        self._setup_param_shm()
+
+        # declaration-order (buffer, template) pairs consumed by the
+        # generated _write_params, plus the prebuilt input list it returns;
+        # built after _setup_param_shm so the pairs hold the final buffers
+        self._param_pairs = tuple(
+            (self._param_bufs[name], self._param_templates[name])
+            for name, _ in _PARAM_SOURCES
+        )
+        self._input_list = [self._prompt_input] + [
+            self._param_templates[name] for name, _ in _PARAM_SOURCES
+        ]
+
+        # models already confirmed ready, so request_streaming doesn't pay a
+        # ModelReady round-trip per prompt
+        self._ready_models: set = set()
+
+        # One long-lived bidirectional stream carries every request; each
+        # in-flight request id maps to the sink feeding its prompt pipes.
+        # grpc marks the stream unusable after any RpcError, so a broken
+        # stream is flagged here and rebuilt on the next submission.
+        self._sinks: Dict[str, _StreamSink] = {}
+        self._stream_broken = False
+        self._submit_lock = threading.Lock()
+        self.client.start_stream(callback=self._global_callback)
+
+    def _setup_param_shm(self) -> None:
+        """Move the scalar sampling params into a system shared-memory region.
+
+        With the params in shared memory the gRPC request only carries a
+        region reference for nine of its ten inputs; writing a new value into
+        the numpy view is the update, no re-serialization needed. Only
+        possible when the server runs on the same host, so failures fall back
+        to inline tensors.
+        """
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=_PARAM_DTYPE.itemsize)
+        except OSError:
+            return
+
+        try:
+            self.client.register_system_shared_memory(shm.name, "/" + shm.name, shm.size)
+        except InferenceServerException:
+            # remote server, or shared memory disabled on it
+            shm.close()
+            shm.unlink()
+            return
+
+        record = np.ndarray(1, dtype=_PARAM_DTYPE, buffer=shm.buf)
+        record[:] = self._param_record
+        self._param_record = record
+        self._param_bufs = {
+            name: record[name].reshape(1, 1) for name in _PARAM_DTYPE.names
+        }
+        for name in _PARAM_DTYPE.names:
+            field_dtype, field_offset = _PARAM_DTYPE.fields[name]
+            self._param_templates[name].set_shared_memory(
+                shm.name, field_dtype.itemsize, offset=field_offset
+            )
+        self._shm = shm
+
+    def close(self) -> None:
+        """Release the connection and any registered shared-memory region."""
+        self.client.stop_stream()
+        if self._shm is not None:
+            try:
+                self.client.unregister_system_shared_memory(self._shm.name)
+            except InferenceServerException:
+                pass
+            self._shm.close()
+            self._shm.unlink()
+            self._shm = None
+        self.client.close()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except Exception:  # pylint: disable=broad-except
+            pass
+
     def load_model(self, model_name: str, timeout: int = 1000) -> None:
         """Load a model into the server."""
         # Expect running triton with --model-control-mode explicit so the actual model can be loaded afterwards
+        if model_name in self._ready_models:
+            return
         if self.client.is_model_ready(model_name):
+            self._ready_models.add(model_name)
             return
 
         self.client.load_model(model_name)
         t0 = time.perf_counter()
-        t1 = t0
-        while not self.client.is_model_ready(model_name) and t1 - t0 < timeout:
-            t1 = time.perf_counter()
-        if not self.client.is_model_ready(model_name):
-            raise RuntimeError(f"Failed to load {model_name} on Triton in {timeout}s")
+        delay = 0.05
+        while not self.client.is_model_ready(model_name):
+            if time.perf_counter() - t0 > timeout:
+                raise RuntimeError(
+                    f"Failed to load {model_name} on Triton in {timeout}s"
+                )
+            # back off between readiness probes so a large model load doesn't
+            # get hammered with ModelReady RPCs
+            time.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        self._ready_models.add(model_name)
 
     def get_model_list(self) -> List[str]:
         """Get a list of models loaded in the triton server."""
@@ -202,104 +567,95 @@ class TritonClient:
         return sum(instance["count"] * len(instance["gpus"]) for instance in instances)
 
     @staticmethod
-    def process_result(result: Dict[str, str]) -> Dict[str, str]:
-        """Post-process the result from the server."""
-        import google.protobuf.json_format  # pylint: disable=import-outside-toplevel
-        import tritonclient.grpc as grpcclient  # pylint: disable=import-outside-toplevel
-
-        # pylint: disable-next=import-outside-toplevel
-        from tritonclient.grpc.service_pb2 import ModelInferResponse
-
-        message = ModelInferResponse()
-        google.protobuf.json_format.Parse(json.dumps(result), message)
-        infer_result = grpcclient.InferResult(message)
-        np_res = infer_result.as_numpy("OUTPUT_0")
-        if np_res.ndim == 2:
-            generated_text = np_res[0, 0].decode()
-        else:
-            generated_text = np_res[0].decode()
-
-        return {
-            "OUTPUT_0": generated_text,
-        }
+    def process_result(response: Any) -> List[str]:
+        """Decode the OUTPUT_0 rows straight from the raw tensor bytes.
 
-    def stream_callback(
-        self,
-        result_queue: queue.Queue[Union[Optional[Dict[str, str]], str]],
-        result: Any,
-        error: str,
-    ) -> None:
-        """Add streamed result to queue."""
+        BYTES tensors arrive as repeated <uint32 length><utf8 payload>
+        records, so slicing them out here skips the InferResult wrapper and
+        the numpy object array it would otherwise build for every token.
+        """
+        raw = response.raw_output_contents[0]
+        rows = []
+        pos = 0
+        end = len(raw)
+        while pos < end:
+            n = int.from_bytes(raw[pos : pos + 4], "little")
+            pos += 4
+            rows.append(raw[pos : pos + n].decode("utf-8"))
+            pos += n
+        return rows
+
+    def _global_callback(self, result: Any, error: str) -> None:
+        """Route a streamed response to the sink of the owning request."""
         if error:
-            result_queue.put(error)
-        else:
-            response = result.get_response(as_json=True)
-            if "outputs" in response:
-                # the very last response might have no output, just the final flag
-                result_queue.put(self.process_result(response))
-
-            if response["parameters"]["triton_final_response"]["bool_param"]:
-                # end of the generation
-                result_queue.put(None)
-
-    def send_prompt_streaming(
-        self,
-        model_name: str,
-        request_inputs: Any,
-        request_outputs: Optional[Any],
-        result_queue: queue.Queue[Union[Optional[Dict[str, str]], str]],
-    ) -> None:
-        """Send the prompt and start streaming the result."""
-        self.client.start_stream(callback=partial(self.stream_callback, result_queue))
-        self.client.async_stream_infer(
-            model_name=model_name,
-            inputs=request_inputs,
-            outputs=request_outputs,
-            enable_empty_final_response=True,
-        )
+            # errors don't reliably carry a request id, so fail everything
+            # that is currently in flight and force a readiness re-check on
+            # the next call. The stream can't be restarted from its own
+            # callback thread, so just flag it for request_streaming.
+            for sink in self._sinks.values():
+                sink.fail(error)
+            self._sinks.clear()
+            self._ready_models.clear()
+            self._stream_broken = True
+            return
+
+        response = result.get_response()
+        sink = self._sinks.get(response.id)
+        if sink is not None and sink(response):
+            del self._sinks[response.id]
 
     def request_streaming(
         self,
         model_name: str,
-        result_queue: queue.Queue[Union[Optional[Dict[str, str]], str]],
+        pipes: List[_TokenPipe],
         **params: Any,
     ) -> None:
-        """Request a streaming connection."""
-        if not self.client.is_model_ready(model_name):
+        """Submit a prompt batch on the persistent stream."""
+        if model_name not in self._ready_models:
             raise RuntimeError("Cannot request streaming, model is not loaded")
-        inputs = self.generate_inputs(**params)
-        outputs = self.generate_outputs()
-        self.send_prompt_streaming(model_name, inputs, outputs, result_queue)
-
-    def close_streaming(self) -> None:
-        """Close the streaming connection."""
-        # unfortunately we can't do it inside the callback
-        self.client.stop_stream()
+        # the lock makes the in-flight check in generate_inputs reliable and
+        # keeps input building and submission atomic across threads
+        with self._submit_lock:
+            if self._stream_broken:
+                # rebuild the stream torn down by the last error; grpc
+                # refuses to enqueue anything on the old one
+                self.client.stop_stream()
+                self.client.start_stream(callback=self._global_callback)
+                self._stream_broken = False
+            inputs = self.generate_inputs(**params)
+            outputs = self.generate_outputs()
+            request_id = str(uuid.uuid4())
+            self._sinks[request_id] = _StreamSink(pipes)
+            try:
+                self.client.async_stream_infer(
+                    model_name=model_name,
+                    inputs=inputs,
+                    outputs=outputs,
+                    request_id=request_id,
+                    enable_empty_final_response=True,
+                )
+            except InferenceServerException:
+                del self._sinks[request_id]
+                self._stream_broken = True
+                raise
 
     @staticmethod
     def generate_outputs() -> List["grpcclient.InferRequestedOutput"]:
         """Generate the expected output structure."""
-        import tritonclient.grpc as grpcclient  # pylint: disable=import-outside-toplevel
-
-        return [grpcclient.InferRequestedOutput("OUTPUT_0")]
+        return _OUTPUTS
 
     @staticmethod
     def prepare_tensor(name: str, input_data: Any) -> "grpcclient.InferInput":
         """Prepare an input data structure."""
-        import tritonclient.grpc as grpcclient  # pylint: disable=import-outside-toplevel
-
-        # pylint: disable-next=import-outside-toplevel
-        from tritonclient.utils import np_to_triton_dtype
-
         t = grpcclient.InferInput(
             name, input_data.shape, np_to_triton_dtype(input_data.dtype)
         )
         t.set_data_from_numpy(input_data)
         return t
 
-    @staticmethod
-    def generate_inputs(  # pylint: disable=too-many-arguments,too-many-locals
-        prompt: str,
+    def generate_inputs(  # pylint: disable=too-many-arguments
+        self,
+        prompts: List[str],
         tokens: int = 32,
         temperature: float = 0.5,
         top_k: float = 0,
@@ -308,24 +664,67 @@ class TritonClient:
         repetition_penalty: float = 1,
         length_penalty: float = 1.0,
     ) -> List["grpcclient.InferInput"]:
-        """Create the input for the triton inference server."""
-        import numpy as np  # pylint: disable=import-outside-toplevel
+        """Create the batched input for the triton inference server."""
+        if len(prompts) > 1 or self._sinks:
+            # the shared prompt tensor and shm-backed param record belong to
+            # whatever request is currently in flight -- the server may read
+            # the region after submission -- so overlapping requests get
+            # fresh inline tensors instead
+            return self._batched_inputs(
+                prompts,
+                tokens,
+                temperature,
+                top_k,
+                top_p,
+                beam_width,
+                repetition_penalty,
+                length_penalty,
+            )
+
+        self._prompt_input.set_data_from_numpy(
+            np.array(prompts, dtype=object).reshape(-1, 1)
+        )
+        self._write_params(
+            tokens,
+            top_k,
+            top_p,
+            temperature,
+            repetition_penalty,
+            length_penalty,
+            beam_width,
+        )
+        return self._input_list
 
+    _write_params = _compile_param_writer()
+
+    @staticmethod
+    def _batched_inputs(  # pylint: disable=too-many-arguments,too-many-locals
+        prompts: List[str],
+        tokens: int,
+        temperature: float,
+        top_k: float,
+        top_p: float,
+        beam_width: int,
+        repetition_penalty: float,
+        length_penalty: float,
+    ) -> List["grpcclient.InferInput"]:
+        """Build fresh (N, 1) input tensors for a multi-prompt batch."""
         # stop = STOP_WORDS
         # bad = BAD_WORDS
 
-        query = np.array(prompt).astype(object)
-        request_output_len = np.array([tokens]).astype(np.uint32).reshape((1, -1))
-        runtime_top_k = np.array([top_k]).astype(np.uint32).reshape((1, -1))
-        runtime_top_p = np.array([top_p]).astype(np.float32).reshape((1, -1))
-        temperature_array = np.array([temperature]).astype(np.float32).reshape((1, -1))
-        len_penalty = np.array([length_penalty]).astype(np.float32).reshape((1, -1))
-        repetition_penalty_array = (
-            np.array([repetition_penalty]).astype(np.float32).reshape((1, -1))
-        )
-        random_seed = np.array([RANDOM_SEED]).astype(np.uint64).reshape((1, -1))
-        beam_width_array = np.array([beam_width]).astype(np.uint32).reshape((1, -1))
-        streaming_data = np.array([[True]], dtype=bool)
+        batch = (len(prompts), 1)
+        query = np.array(prompts, dtype=object).reshape(-1, 1)
+        request_output_len = np.broadcast_to([[tokens]], batch).astype(np.uint32)
+        runtime_top_k = np.broadcast_to([[top_k]], batch).astype(np.uint32)
+        runtime_top_p = np.broadcast_to([[top_p]], batch).astype(np.float32)
+        temperature_array = np.broadcast_to([[temperature]], batch).astype(np.float32)
+        len_penalty = np.broadcast_to([[length_penalty]], batch).astype(np.float32)
+        repetition_penalty_array = np.broadcast_to(
+            [[repetition_penalty]], batch
+        ).astype(np.float32)
+        random_seed = np.broadcast_to([[RANDOM_SEED]], batch).astype(np.uint64)
+        beam_width_array = np.broadcast_to([[beam_width]], batch).astype(np.uint32)
+        streaming_data = np.broadcast_to([[True]], batch).astype(bool)
 
         inputs = [
             TritonClient.prepare_tensor("INPUT_0", query),
@@ -340,3 +739,73 @@ class TritonClient:
             TritonClient.prepare_tensor("streaming", streaming_data),
         ]
         return inputs
+
+
+class AsyncTritonClient:
+    """An asyncio counterpart of TritonClient built on tritonclient.grpc.aio."""
+
+    def __init__(self, server_url: str) -> None:
+        """Initialize the client."""
+        if _TRITON_IMPORT_ERROR is not None:
+            raise _TRITON_IMPORT_ERROR
+
+        self.server_url = server_url
+        self.client = grpcclient_aio.InferenceServerClient(server_url)
+        self._ready_models: set = set()
+
+    async def load_model(self, model_name: str, timeout: int = 1000) -> None:
+        """Load a model into the server."""
+        # same explicit model-control flow as the sync client, minus the
+        # blocked thread
+        if model_name in self._ready_models:
+            return
+        if await self.client.is_model_ready(model_name):
+            self._ready_models.add(model_name)
+            return
+
+        await self.client.load_model(model_name)
+        t0 = time.perf_counter()
+        delay = 0.05
+        while not await self.client.is_model_ready(model_name):
+            if time.perf_counter() - t0 > timeout:
+                raise RuntimeError(
+                    f"Failed to load {model_name} on Triton in {timeout}s"
+                )
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, 1.0)
+        self._ready_models.add(model_name)
+
+    async def stream(
+        self, model_name: str, **params: Any
+    ) -> AsyncGenerator[str, None]:
+        """Yield the generated tokens for a batch of prompts."""
+        if model_name not in self._ready_models:
+            raise RuntimeError("Cannot request streaming, model is not loaded")
+
+        # pylint: disable-next=protected-access
+        inputs = TritonClient._batched_inputs(**params)
+
+        async def requests() -> Any:
+            # the aio stream_infer has no enable_empty_final_response
+            # argument; the flag has to travel as a request parameter
+            yield {
+                "model_name": model_name,
+                "inputs": inputs,
+                "outputs": TritonClient.generate_outputs(),
+                "request_id": str(uuid.uuid4()),
+                "parameters": {"triton_enable_empty_final_response": True},
+            }
+
+        async for result, error in self.client.stream_infer(requests()):
+            if error:
+                raise error
+            response = result.get_response()
+            if len(response.outputs) > 0:
+                for text in TritonClient.process_result(response):
+                    yield text
+            if response.parameters["triton_final_response"].bool_param:
+                break
+
+    async def close(self) -> None:
+        """Release the connection."""
+        await self.client.close()